@@ -3,18 +3,73 @@
 from __future__ import annotations
 
 import argparse
+import asyncio
+import collections
+import contextlib
+import errno
+import functools
+import hashlib
+import importlib.util
+import json
 import os
+import platform
+import queue
+import re
 import shlex
+import shutil
+import sqlite3
 import subprocess
 import sys
-from typing import Optional
+import tempfile
+import threading
+import urllib.request
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Iterable, NamedTuple, Optional
 
-# Load .env early so environment variables are available at import time
-from dotenv import load_dotenv
+FASTER_WHISPER_BATCH_SIZE = 16
+_SAMPLE_RATE = 16000  # what whisper models expect
+_IOURING_ENTRIES = 64
+YT_DLP_URL = "https://github.com/yt-dlp/yt-dlp/releases/latest/download/yt-dlp"
+WHISPER_STDERR_TAIL = 50  # stderr lines of a failed whisper run kept for the error report
 
-load_dotenv()
 
-DEBUG = os.environ.get("DEBUG", "FALSE") == "TRUE"
+def _read_env_flags() -> None:
+    """(Re)read the module-level switches from the environment."""
+    global DEBUG, USE_FASTER_WHISPER, USE_NODE_TRANSLATOR, TRANSLATION_CONCURRENCY, USE_IOURING
+    global WHISPER_CHUNK_SECONDS, WHISPER_WORKERS
+    DEBUG = os.environ.get("DEBUG", "FALSE") == "TRUE"
+    # Transcribe in-process with faster-whisper when it is installed; FALSE forces the whisper CLI
+    USE_FASTER_WHISPER = os.environ.get("USE_FASTER_WHISPER", "TRUE") == "TRUE"
+    # Translate through the node translator instead of the OpenAI Python client
+    USE_NODE_TRANSLATOR = os.environ.get("USE_NODE_TRANSLATOR", "FALSE") in ("1", "TRUE")
+    # Chat completion requests in flight at once when translating with the OpenAI client
+    TRANSLATION_CONCURRENCY = int(os.environ.get("TRANSLATION_CONCURRENCY", "4"))
+    # Batch file deletions through io_uring (Linux only, needs the optional liburing package)
+    USE_IOURING = os.environ.get("USE_IOURING", "FALSE") in ("1", "TRUE") and platform.system() == "Linux"
+    # Long inputs are cut on silences into chunks of about this many seconds and transcribed in parallel
+    WHISPER_CHUNK_SECONDS = float(os.environ.get("WHISPER_CHUNK_SECONDS", "300"))
+    # Parallel faster-whisper workers; 0 picks a count from the device (GPU memory or CPU cores)
+    WHISPER_WORKERS = int(os.environ.get("WHISPER_WORKERS", "0"))
+
+
+_read_env_flags()
+
+_DOTENV_LOADED = False
+
+
+def _ensure_dotenv() -> None:
+    """Load ``.env`` on first use rather than at import, then refresh the switches above."""
+    global _DOTENV_LOADED
+    if not _DOTENV_LOADED:
+        from dotenv import load_dotenv
+
+        load_dotenv()
+        _DOTENV_LOADED = True
+        _read_env_flags()
+
+
+# Rough faster-whisper memory use per worker in GiB (int8 weights plus batched activations)
+_WHISPER_WORKER_FOOTPRINT_GB = {"tiny": 0.5, "base": 0.7, "small": 1.2, "medium": 2.5, "large": 4.0, "turbo": 3.0}
 
 
 def debug(msg: str) -> None:
@@ -22,27 +77,174 @@ def debug(msg: str) -> None:
         print(f"[DEBUG] {msg}", file=sys.stderr)
 
 
+class Cue(NamedTuple):
+    """A single subtitle cue; times are in milliseconds."""
+
+    start: int
+    end: int
+    text: str
+
+
+# Segment lines whisper prints while transcribing, e.g. "[00:01.000 --> 00:04.500]  Hello there"
+_WHISPER_SEGMENT_RE = re.compile(r"^\[((?:\d+:)?\d{2}:\d{2}\.\d{3}) --> ((?:\d+:)?\d{2}:\d{2}\.\d{3})\]\s*(.*)$")
+# One SRT cue: optional index line, timing line, then every following non-blank line as text.
+# read_srt runs this over the whole file so the scanning happens inside the regex engine.
+_SRT_CUE_RE = re.compile(
+    r"^(?:\d+[ \t]*\n)?"
+    r"(\d+):(\d\d):(\d\d)[,.](\d{3})[ \t]*-->[ \t]*(\d+):(\d\d):(\d\d)[,.](\d{3})[^\n]*"
+    r"((?:\n(?![ \t]*(?:\n|\Z)).*)*)",
+    re.M,
+)
+# A blank line ends an SRT cue, so translated texts must not contain one
+_BLANK_LINES_RE = re.compile(r"\n\s*\n")
+
+
+def parse_timestamp(ts: str) -> int:
+    """Convert ``HH:MM:SS,mmm`` (SRT) or ``MM:SS.mmm`` (whisper console) into milliseconds."""
+    *hm, sec = ts.replace(",", ".").split(":")
+    hours, minutes = ([0] * (2 - len(hm)) + [int(x) for x in hm])
+    seconds, millis = sec.split(".")
+    return ((hours * 60 + minutes) * 60 + int(seconds)) * 1000 + int(millis)
+
+
+def format_timestamp(ms: int) -> str:
+    hours, ms = divmod(ms, 3_600_000)
+    minutes, ms = divmod(ms, 60_000)
+    seconds, ms = divmod(ms, 1000)
+    return f"{hours:02d}:{minutes:02d}:{seconds:02d},{ms:03d}"
+
+
+def read_srt(path: str) -> list[Cue]:
+    with open(path, encoding="utf-8-sig") as f:
+        content = f.read().replace("\r\n", "\n")
+    return [
+        Cue(
+            ((int(h1) * 60 + int(m1)) * 60 + int(s1)) * 1000 + int(ms1),
+            ((int(h2) * 60 + int(m2)) * 60 + int(s2)) * 1000 + int(ms2),
+            text.strip(),
+        )
+        for h1, m1, s1, ms1, h2, m2, s2, ms2, text in _SRT_CUE_RE.findall(content)
+    ]
+
+
+def write_srt(cues: list[Cue], path: str) -> None:
+    """Write *cues* to *path* as SRT, numbering them from 1."""
+    blocks = [
+        f"{i}\n{format_timestamp(cue.start)} --> {format_timestamp(cue.end)}\n{cue.text}\n\n"
+        for i, cue in enumerate(cues, 1)
+    ]
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("".join(blocks))
+
+
+def debug_cmd(cmd: list[str]) -> None:
+    # quoting every argument costs a regex scan per token, so only do it when the line is printed
+    if DEBUG:
+        debug("Running command: " + " ".join(shlex.quote(c) for c in cmd))
+
+
 def run_cmd(cmd: list[str], check: bool = True, capture_output: bool = False, env=None) -> subprocess.CompletedProcess:
-    debug(f"Running command: {' '.join(shlex.quote(c) for c in cmd)}")
+    debug_cmd(cmd)
     return subprocess.run(cmd, check=check, capture_output=capture_output, env=env)
 
 
+def remove_files(paths: list[str]) -> dict[str, OSError]:
+    """Delete *paths*; returns the error for every path that could not be removed.
+
+    With ``USE_IOURING`` the unlinks are queued on an io_uring and submitted in batches,
+    one syscall per batch. Without it, or when io_uring can't be set up, files are removed
+    one at a time.
+    """
+    if USE_IOURING and paths:
+        try:
+            import liburing
+
+            ring = liburing.Ring()
+            liburing.io_uring_queue_init(_IOURING_ENTRIES, ring)
+        except (ImportError, OSError) as e:
+            debug(f"io_uring unavailable, removing files one by one: {e}")
+        else:
+            try:
+                return _unlink_iouring(liburing, ring, paths)
+            finally:
+                liburing.io_uring_queue_exit(ring)
+
+    errors = {}
+    for path in paths:
+        try:
+            os.remove(path)
+        except OSError as e:
+            errors[path] = e
+    return errors
+
+
+def _unlink_iouring(liburing, ring, paths: list[str]) -> dict[str, OSError]:
+    errors = {}
+    cqe = liburing.Cqe()
+    for start in range(0, len(paths), _IOURING_ENTRIES):
+        batch = paths[start : start + _IOURING_ENTRIES]
+        for i, path in enumerate(batch):
+            sqe = liburing.io_uring_get_sqe(ring)
+            liburing.io_uring_prep_unlink(sqe, path)
+            sqe.user_data = i
+        liburing.io_uring_submit_and_wait(ring, len(batch))
+        liburing.io_uring_peek_cqe(ring, cqe)
+        ready = liburing.io_uring_cq_ready(ring)
+        for n in range(ready):
+            entry = cqe[n]
+            i = entry.user_data
+            try:
+                entry.res  # raises the unlink's errno as OSError
+            except OSError as e:
+                errors[batch[i]] = e
+        liburing.io_uring_cq_advance(ring, ready)
+    return errors
+
+
 def update_ytdlp(yt_dlp_path: str) -> None:
+    """Replace *yt_dlp_path* with the latest yt-dlp release.
+
+    The binary is downloaded next to the target and renamed over it, so no subprocess is
+    needed when the directory is writable; otherwise ``sudo wget`` / ``sudo chmod`` are used.
+    """
     print("=== Updating yt-dlp ===", file=sys.stderr)
-    cmd = [
-        "sudo",
-        "wget",
-        "https://github.com/yt-dlp/yt-dlp/releases/latest/download/yt-dlp",
-        "-O",
-        yt_dlp_path,
-    ]
-    run_cmd(cmd)
-    run_cmd(["sudo", "chmod", "a+rx", yt_dlp_path])
+    tmp = yt_dlp_path + ".tmp"
+    try:
+        debug(f"Downloading {YT_DLP_URL} to {tmp}")
+        try:
+            urllib.request.urlretrieve(YT_DLP_URL, tmp)
+            os.chmod(tmp, os.stat(tmp).st_mode | 0o755)
+            os.replace(tmp, yt_dlp_path)
+        except BaseException:
+            with contextlib.suppress(OSError):
+                os.remove(tmp)
+            raise
+    except PermissionError:
+        debug(f"{os.path.dirname(yt_dlp_path)} is not writable, updating with sudo")
+        run_cmd(["sudo", "wget", YT_DLP_URL, "-O", yt_dlp_path])
+        run_cmd(["sudo", "chmod", "a+rx", yt_dlp_path])
     print("yt-dlp updated successfully", file=sys.stderr)
-    run_cmd([yt_dlp_path, "--version"])  # show version
+    # showing the version is informational only
+    try:
+        run_cmd([yt_dlp_path, "--version"], check=False)
+    except OSError as e:
+        debug(f"Could not run {yt_dlp_path} --version: {e}")
+
 
+def download_video(
+    url: str,
+    output_dir: str,
+    yt_dlp_path: str,
+    output_name: str,
+    yt_dlp_format: str,
+    stream: bool = False,
+) -> str | tuple[subprocess.Popen, str]:
+    """Download *url* into *output_dir* and return the path of the downloaded file.
 
-def download_video(url: str, output_dir: str, yt_dlp_path: str, output_name: str, yt_dlp_format: str) -> str:
+    With *stream* the download keeps running in the background and ``(proc, path)`` is
+    returned as soon as yt-dlp has decided on the output file name; the caller must wait
+    for *proc* before using *path*.
+    """
     print("=== Downloading video from URL ===", file=sys.stderr)
     debug(f"URL: {url}")
     debug(f"Output directory: {output_dir}")
@@ -50,42 +252,385 @@ def download_video(url: str, output_dir: str, yt_dlp_path: str, output_name: str
     if not os.path.exists(yt_dlp_path) or not os.access(yt_dlp_path, os.X_OK):
         raise FileNotFoundError(f"yt-dlp not found at {yt_dlp_path}. Run --update-ytdlp to install.")
 
+    prefix = output_name + "."
+
     # Remove old downloaded files
-    for fname in os.listdir(output_dir):
-        if fname.startswith(output_name + "."):
-            try:
-                os.remove(os.path.join(output_dir, fname))
-            except Exception:
-                pass
+    with os.scandir(output_dir) as it:
+        for e in it:
+            if e.name.startswith(prefix):
+                try:
+                    os.remove(e.path)
+                except Exception:
+                    pass
 
     out_template = os.path.join(output_dir, f"{output_name}.%(ext)s")
     cmd = [yt_dlp_path, "-o", out_template]
     if yt_dlp_format:
         cmd += ["-f", yt_dlp_format]
+    if stream:
+        return _start_download(cmd, url)
     cmd += [url]
     run_cmd(cmd)
 
-    # pick newest matching file (safe listing + debug on failure)
+    # pick newest matching file in a single pass (safe listing + debug on failure); DirEntry.stat()
+    # is served from the directory scan where the platform allows, so there is no extra stat per file
+    downloaded = None
+    newest_mtime = -1.0
     try:
-        dir_list = os.listdir(output_dir)
+        with os.scandir(output_dir) as it:
+            for e in it:
+                if e.name.startswith(prefix):
+                    mtime = e.stat().st_mtime
+                    if mtime > newest_mtime:
+                        newest_mtime, downloaded = mtime, e.path
     except Exception:
-        dir_list = []
+        pass
 
-    candidates = [os.path.join(output_dir, f) for f in dir_list if f.startswith(output_name + ".")]
-    if not candidates:
+    if downloaded is None:
         debug(f"Looking in output_dir: {output_dir}")
-        debug(f"Directory listing: {dir_list}")
         raise FileNotFoundError("Could not find downloaded video file")
-    candidates.sort(key=lambda p: os.path.getmtime(p), reverse=True)
-    downloaded = candidates[0]
     debug(f"Downloaded file: {downloaded}")
     return downloaded
 
 
-def ensure_whisper(video_file: str, video_dir: str, whisper_model: str, whisper_lang: str) -> None:
+def _start_download(cmd: list[str], url: str) -> tuple[subprocess.Popen, str]:
+    # --print implies --quiet; --progress keeps the progress bar on stderr
+    cmd = cmd + ["--print", "filename", "--no-simulate", "--progress", url]
+    debug_cmd(cmd)
+    proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, text=True)
+    path = proc.stdout.readline().strip()
+    if not path:
+        proc.kill()
+        proc.wait()
+        raise RuntimeError("yt-dlp did not report an output file name")
+
+    # keep draining stdout so yt-dlp never blocks on a full pipe
+    def drain() -> None:
+        for line in proc.stdout:
+            sys.stderr.write(line)
+
+    threading.Thread(target=drain, daemon=True).start()
+    debug(f"Downloading to: {path}")
+    return proc, path
+
+
+def _audio_format(yt_dlp_format: Optional[str]) -> str:
+    """yt-dlp selector for the audio that *yt_dlp_format* muxes into the downloaded video.
+
+    ``video+audio`` alternatives contribute their audio part and other alternatives are kept,
+    so the transcribed track matches the saved one; a bare ``best`` becomes ``worst`` so a site
+    without audio-only formats does not send the full-resolution video a second time.
+    """
+    if not yt_dlp_format or "(" in yt_dlp_format:
+        return "bestaudio/worst"
+    alternatives: list[str] = []
+    for alt in yt_dlp_format.split("/"):
+        part = alt.rsplit("+", 1)[-1].strip()
+        if part in ("best", "b"):
+            part = "worst"
+        if part and part not in alternatives:
+            alternatives.append(part)
+    return "/".join(alternatives)
+
+
+def download_and_yield_audio_chunks(url: str, yt_dlp_path: str, chunk_seconds: float, yt_dlp_format: Optional[str] = None):
+    """Stream the audio track of *url* as 16 kHz mono float32 chunks, ready for faster-whisper.
+
+    yt-dlp writes the audio format picked by :func:`_audio_format` to a pipe and ffmpeg decodes
+    it to PCM while it is still downloading. Yields ``(offset_seconds, samples)``; chunks are
+    about *chunk_seconds* long and end at the quietest moment of their last few seconds so
+    words are not split.
+    """
+    import numpy as np
+
+    ytdlp_cmd = [yt_dlp_path, "--quiet", "-f", _audio_format(yt_dlp_format), "-o", "-", url]
+    ffmpeg_cmd = [
+        "ffmpeg", "-hide_banner", "-loglevel", "error", "-i", "pipe:0",
+        "-vn", "-ac", "1", "-ar", str(_SAMPLE_RATE), "-f", "s16le", "pipe:1",
+    ]  # fmt: skip
+    debug_cmd(ytdlp_cmd)
+    debug_cmd(ffmpeg_cmd)
+    ytdlp = subprocess.Popen(ytdlp_cmd, stdout=subprocess.PIPE)
+    ffmpeg = subprocess.Popen(ffmpeg_cmd, stdin=ytdlp.stdout, stdout=subprocess.PIPE)
+    ytdlp.stdout.close()  # ffmpeg owns the read end now
+
+    chunk_samples = int(chunk_seconds * _SAMPLE_RATE)
+    offset = 0
+    pending = np.empty(0, dtype=np.float32)
+    try:
+        while data := ffmpeg.stdout.read(chunk_samples * 2):
+            pending = np.concatenate([pending, np.frombuffer(data, dtype=np.int16).astype(np.float32) / 32768.0])
+            if len(pending) < chunk_samples:
+                continue
+            cut = _quiet_cut(pending)
+            yield offset / _SAMPLE_RATE, pending[:cut]
+            offset += cut
+            pending = pending[cut:]
+        if len(pending):
+            yield offset / _SAMPLE_RATE, pending
+    finally:
+        for proc in (ffmpeg, ytdlp):
+            if proc.poll() is None:
+                proc.kill()
+        ffmpeg.stdout.close()
+    for proc, cmd in ((ytdlp, ytdlp_cmd), (ffmpeg, ffmpeg_cmd)):
+        if proc.wait() != 0:
+            raise subprocess.CalledProcessError(proc.returncode, cmd)
+
+
+def _quiet_cut(samples, search_seconds: float = 5.0, frame_seconds: float = 0.1) -> int:
+    """Index of the quietest frame centre within the last *search_seconds* (at most half) of *samples*."""
+    frame = int(frame_seconds * _SAMPLE_RATE)
+    search = min(len(samples) // 2, int(search_seconds * _SAMPLE_RATE)) // frame * frame
+    if not search:
+        return len(samples)
+    tail = samples[len(samples) - search :]
+    energy = (tail.reshape(-1, frame) ** 2).mean(axis=1)
+    return len(samples) - search + int(energy.argmin()) * frame + frame // 2
+
+
+def faster_whisper_available() -> bool:
+    return USE_FASTER_WHISPER and importlib.util.find_spec("faster_whisper") is not None
+
+
+def ensure_whisper(
+    video_file: str,
+    video_dir: str,
+    whisper_model: str,
+    whisper_lang: str,
+    on_cue: Optional[Callable[[Cue], None]] = None,
+    audio: Optional[Iterable[tuple[float, Any]]] = None,
+) -> None:
+    """Transcribe *video_file* into ``<video_dir>/<name>.srt``.
+
+    Uses faster-whisper in-process when it is installed (and ``USE_FASTER_WHISPER`` isn't
+    ``FALSE``), otherwise the ``whisper`` CLI. When *on_cue* is given, every segment is passed
+    to the callback as soon as it has been transcribed. *audio* replaces reading *video_file*
+    with ``(offset_seconds, samples)`` chunks such as those from
+    :func:`download_and_yield_audio_chunks`; it needs faster-whisper.
+    """
     print(f"=== Step 1: Generating {whisper_lang} subtitles with Whisper ===")
     debug(f"Running Whisper with model: {whisper_model}, language: {whisper_lang}")
-    run_cmd([
+    if USE_FASTER_WHISPER:
+        try:
+            pipeline, workers = load_faster_whisper(whisper_model)
+        except ImportError:
+            if audio is not None:
+                raise
+            debug("faster-whisper is not installed, falling back to the whisper CLI")
+        else:
+            srt_path = os.path.join(video_dir, os.path.splitext(os.path.basename(video_file))[0] + ".srt")
+            _transcribe_faster_whisper(pipeline, workers, audio or video_file, srt_path, whisper_lang, on_cue)
+            return
+    if audio is not None:
+        raise RuntimeError("Transcribing streamed audio requires faster-whisper")
+    _transcribe_whisper_cli(video_file, video_dir, whisper_model, whisper_lang, on_cue)
+
+
+@functools.lru_cache(maxsize=1)
+def load_faster_whisper(whisper_model: str):
+    """Load *whisper_model* with faster-whisper, int8-quantized, wrapped in a batched pipeline.
+
+    Returns ``(pipeline, workers)`` where *workers* is how many transcriptions the model can
+    run concurrently. The result is cached so several videos share one loaded model.
+    Raises ImportError when faster-whisper is not available.
+    """
+    import ctranslate2
+    from faster_whisper import BatchedInferencePipeline, WhisperModel
+
+    if ctranslate2.get_cuda_device_count() > 0:
+        device, compute_type = "cuda", "int8_float16"
+    else:
+        device, compute_type = "cpu", "int8"
+    workers = WHISPER_WORKERS or _whisper_worker_count(device, whisper_model)
+    debug(f"Loading faster-whisper model {whisper_model} on {device} ({compute_type}, {workers} workers)")
+    model = WhisperModel(whisper_model, device=device, compute_type=compute_type, num_workers=workers)
+    return BatchedInferencePipeline(model=model), workers
+
+
+def _whisper_worker_count(device: str, whisper_model: str) -> int:
+    if device == "cpu":
+        # each CTranslate2 CPU worker runs 4 threads by default
+        return max(1, (os.cpu_count() or 1) // 4)
+    try:
+        import torch
+
+        total_gb = torch.cuda.get_device_properties(0).total_memory / 2**30
+    except Exception:
+        return 1
+    size = whisper_model.split("-")[0].split(".")[0]
+    footprint = _WHISPER_WORKER_FOOTPRINT_GB.get(size, _WHISPER_WORKER_FOOTPRINT_GB["large"])
+    return max(1, int(total_gb // footprint))
+
+
+def split_audio_on_silence(video_file: str, work_dir: str, chunk_seconds: float) -> list[tuple[float, float, str]]:
+    """Cut the audio of *video_file* into ~*chunk_seconds* long 16 kHz mono WAVs in *work_dir*.
+
+    Cuts are placed in the middle of silences found by ffmpeg's ``silencedetect`` so no
+    speech is split. Returns ``(start, end, wav_path)`` per chunk, times in seconds; when no
+    cut is needed the single chunk is *video_file* itself and nothing is decoded.
+    """
+    proc = run_cmd(
+        ["ffmpeg", "-hide_banner", "-nostats", "-i", video_file, "-vn", "-af", "silencedetect=noise=-30dB:d=0.5", "-f", "null", "-"],
+        capture_output=True,
+    )
+    duration, cuts = _silence_cut_points(proc.stderr.decode("utf-8", "replace"), chunk_seconds)
+    if not cuts:
+        return [(0.0, duration, video_file)]
+
+    run_cmd(
+        ["ffmpeg", "-hide_banner", "-loglevel", "error", "-y", "-i", video_file, "-vn", "-ac", "1", "-ar", "16000"]
+        + ["-f", "segment", "-segment_times", ",".join(f"{c:.3f}" for c in cuts), "-reset_timestamps", "1"]
+        + [os.path.join(work_dir, "chunk_%05d.wav")]
+    )
+
+    bounds = [0.0, *cuts, duration]
+    return [(bounds[i], bounds[i + 1], os.path.join(work_dir, f"chunk_{i:05d}.wav")) for i in range(len(bounds) - 1)]
+
+
+def _silence_cut_points(ffmpeg_log: str, chunk_seconds: float) -> tuple[float, list[float]]:
+    """Parse ffmpeg silencedetect output into ``(duration, cut_points)``."""
+    m = re.search(r"Duration: (\d+):(\d{2}):(\d{2}(?:\.\d+)?)", ffmpeg_log)
+    if not m:
+        raise RuntimeError("Could not determine media duration")
+    duration = (int(m[1]) * 60 + int(m[2])) * 60 + float(m[3])
+
+    starts = [float(x) for x in re.findall(r"silence_start: (-?\d+(?:\.\d+)?)", ffmpeg_log)]
+    ends = [float(x) for x in re.findall(r"silence_end: (-?\d+(?:\.\d+)?)", ffmpeg_log)]
+    cuts: list[float] = []
+    last = 0.0
+    for start, end in zip(starts, ends + [duration] * (len(starts) - len(ends))):
+        mid = (max(start, 0.0) + end) / 2
+        # don't leave a tiny trailing chunk behind the last cut
+        if mid - last >= chunk_seconds and duration - mid >= chunk_seconds / 4:
+            cuts.append(mid)
+            last = mid
+    return duration, cuts
+
+
+def _transcribe_faster_whisper(
+    pipeline,
+    workers: int,
+    video_file,
+    srt_path: str,
+    whisper_lang: str,
+    on_cue: Optional[Callable[[Cue], None]],
+) -> None:
+    """*video_file* is a path or an iterable of ``(offset_seconds, samples)`` chunks."""
+
+    def transcribe(audio, offset: float = 0.0) -> list[Cue]:
+        segments, _ = pipeline.transcribe(audio, language=whisper_lang, batch_size=FASTER_WHISPER_BATCH_SIZE)
+        # segments is a generator: decoding happens while we iterate, i.e. in the calling thread
+        return [
+            Cue(round((offset + seg.start) * 1000), round((offset + seg.end) * 1000), seg.text.strip())
+            for seg in segments
+        ]
+
+    def emit(cues: list[Cue]) -> None:
+        for cue in cues:
+            print(f"[{format_timestamp(cue.start)} --> {format_timestamp(cue.end)}] {cue.text}")
+            if on_cue is not None:
+                on_cue(cue)
+
+    cues: list[Cue] = []
+    if not isinstance(video_file, str):
+        for offset, samples in video_file:
+            chunk_cues = transcribe(samples, offset)
+            emit(chunk_cues)
+            cues += chunk_cues
+        write_srt(cues, srt_path)
+        return
+
+    with tempfile.TemporaryDirectory(prefix="translate_movie_") as tmp:
+        chunks = []
+        if workers > 1:
+            try:
+                chunks = split_audio_on_silence(video_file, tmp, WHISPER_CHUNK_SECONDS)
+            except (OSError, subprocess.CalledProcessError, RuntimeError) as e:
+                debug(f"Could not split audio, transcribing in one piece: {e}")
+        if len(chunks) > 1:
+            debug(f"Transcribing {len(chunks)} chunks with {workers} workers")
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                # map yields in chunk order, so cues still reach on_cue sorted by time
+                for chunk_cues in pool.map(lambda c: transcribe(c[2], c[0]), chunks):
+                    emit(chunk_cues)
+                    cues += chunk_cues
+        else:
+            segments, info = pipeline.transcribe(video_file, language=whisper_lang, batch_size=FASTER_WHISPER_BATCH_SIZE)
+            debug(f"Audio duration: {info.duration:.1f}s")
+            for seg in segments:
+                cue = Cue(round(seg.start * 1000), round(seg.end * 1000), seg.text.strip())
+                emit([cue])
+                cues.append(cue)
+    write_srt(cues, srt_path)
+
+
+def transcribe_files_cli(video_files: list[str], whisper_model: str, whisper_lang: str) -> None:
+    """Transcribe several files with the whisper CLI, one invocation (one model load) per directory."""
+    print(f"=== Step 1: Generating {whisper_lang} subtitles with Whisper for {len(video_files)} files ===")
+    by_dir: dict[str, list[str]] = {}
+    for video_file in video_files:
+        by_dir.setdefault(os.path.dirname(video_file), []).append(video_file)
+    for video_dir, files in by_dir.items():
+        run_whisper(
+            ["whisper", *files, "--model", whisper_model, "--language", whisper_lang]
+            + ["--output_dir", video_dir or ".", "--output_format", "srt"]
+        )
+
+
+def run_whisper(cmd: list[str], on_line: Optional[Callable[[str], None]] = None, env=None) -> None:
+    """Run a whisper CLI command, passing each stdout line to *on_line* when given.
+
+    With ``DEBUG`` whisper's stderr is teed: echoed as it arrives while the last
+    ``WHISPER_STDERR_TAIL`` lines are kept. On a non-zero exit those lines are attached to the
+    raised :class:`subprocess.CalledProcessError` as ``stderr_tail``. If *on_line* raises,
+    whisper is killed and the exception propagates.
+    """
+    debug_cmd(cmd)
+    tail: collections.deque[str] = collections.deque(maxlen=WHISPER_STDERR_TAIL)
+    with subprocess.Popen(
+        cmd,
+        stdout=subprocess.PIPE if on_line else None,
+        stderr=subprocess.PIPE if DEBUG else None,
+        text=True,
+        encoding="utf-8",
+        errors="replace",
+        env=env,
+    ) as proc:
+        tee = None
+        if proc.stderr:
+
+            def drain() -> None:
+                for line in proc.stderr:
+                    sys.stderr.write(line)
+                    tail.append(line.rstrip("\n"))
+
+            tee = threading.Thread(target=drain, daemon=True)
+            tee.start()
+        if on_line:
+            try:
+                for line in proc.stdout:
+                    on_line(line)
+            except BaseException:
+                proc.kill()
+                raise
+        proc.wait()
+        if tee:
+            tee.join()
+    if proc.returncode != 0:
+        e = subprocess.CalledProcessError(proc.returncode, cmd)
+        e.stderr_tail = list(tail)
+        raise e
+
+
+def _transcribe_whisper_cli(
+    video_file: str,
+    video_dir: str,
+    whisper_model: str,
+    whisper_lang: str,
+    on_cue: Optional[Callable[[Cue], None]],
+) -> None:
+    cmd = [
         "whisper",
         video_file,
         "--model",
@@ -96,7 +641,23 @@ def ensure_whisper(video_file: str, video_dir: str, whisper_model: str, whisper_
         video_dir,
         "--output_format",
         "srt",
-    ])
+        "--verbose",
+        "True",
+    ]
+    if on_cue is None:
+        run_whisper(cmd)
+        return
+
+    def parse(line: str) -> None:
+        sys.stdout.write(line)
+        m = _WHISPER_SEGMENT_RE.match(line.rstrip("\n"))
+        if m:
+            on_cue(Cue(parse_timestamp(m[1]), parse_timestamp(m[2]), m[3].strip()))
+
+    env = os.environ.copy()
+    # whisper is a Python program: without this its segment lines sit in a pipe buffer until exit
+    env["PYTHONUNBUFFERED"] = "1"
+    run_whisper(cmd, parse, env)
 
 
 def translate_subtitles(
@@ -109,12 +670,262 @@ def translate_subtitles(
     batch_sizes: str,
     openai_api_key: str,
     openai_endpoint: str,
+    cache_path: Optional[str] = None,
 ):
     print(f"=== Step 2: Translating subtitles to {target_lang} ===")
+    run_translator(
+        translator_path,
+        openai_model,
+        srt_en,
+        srt_out,
+        source_lang,
+        target_lang,
+        batch_sizes,
+        openai_api_key,
+        openai_endpoint,
+        cache_path=cache_path,
+    )
 
-    env = os.environ.copy()
-    env["OPENAI_API_KEY"] = openai_api_key
-    env["OPENAI_BASE_URL"] = openai_endpoint
+
+def run_translator(
+    translator_path: str,
+    openai_model: str,
+    srt_en: str,
+    srt_out: str,
+    source_lang: str,
+    target_lang: str,
+    batch_sizes: str,
+    openai_api_key: str,
+    openai_endpoint: str,
+    cache_path: Optional[str] = None,
+) -> None:
+    """Translate *srt_en* into *srt_out*, serving cues from the translation cache where possible.
+
+    Cues are translated with the OpenAI Python client, or with the node translator when
+    ``USE_NODE_TRANSLATOR=TRUE`` (or the ``openai`` package is missing). Only cues missing
+    from the cache at *cache_path* are translated; their translations are stored batch by batch.
+    """
+    use_node = USE_NODE_TRANSLATOR or not _openai_available()
+    if use_node and not cache_path:
+        # nothing to merge: let node read and write the files directly
+        _run_node_translator(
+            translator_path,
+            openai_model,
+            srt_en,
+            srt_out,
+            source_lang,
+            target_lang,
+            batch_sizes,
+            openai_api_key,
+            openai_endpoint,
+        )
+        return
+
+    def translate(batch: list[Cue], on_batch: Callable[[int, list[str]], None]) -> None:
+        if use_node:
+            translated = _translate_with_node(
+                batch,
+                translator_path,
+                openai_model,
+                source_lang,
+                target_lang,
+                batch_sizes,
+                openai_api_key,
+                openai_endpoint,
+            )
+            if len(translated) != len(batch):
+                raise RuntimeError(f"Translator returned {len(translated)} cues for {len(batch)} inputs")
+            on_batch(0, translated)
+            return
+        batch_size = json.loads(batch_sizes)[0]
+        asyncio.run(
+            _translate_async(
+                [cue.text for cue in batch],
+                openai_model,
+                source_lang,
+                target_lang,
+                batch_size,
+                openai_api_key,
+                openai_endpoint,
+                on_batch=on_batch,
+            )
+        )
+
+    cues = read_srt(srt_en)
+    lang_key = translation_lang_key(source_lang, target_lang, openai_model)
+    keys = [translation_cache_key(lang_key, cue.text) for cue in cues]
+    conn = open_translation_cache(cache_path) if cache_path else None
+    try:
+        cached = lookup_translations(conn, keys) if conn else {}
+        misses = [i for i, k in enumerate(keys) if k not in cached]
+        debug(f"Translation cache: {len(cues) - len(misses)} hits, {len(misses)} misses")
+
+        def store(start: int, translated: list[str]) -> None:
+            # committed per batch, so a failure later on keeps what was already paid for
+            new = {keys[i]: text for i, text in zip(misses[start:], translated)}
+            if conn:
+                with conn:
+                    conn.executemany("INSERT OR REPLACE INTO t(k, v) VALUES (?, ?)", new.items())
+            cached.update(new)
+
+        if misses:
+            translate([cues[i] for i in misses], store)
+    finally:
+        if conn:
+            conn.close()
+
+    write_srt([cue._replace(text=cached[k]) for cue, k in zip(cues, keys)], srt_out)
+
+
+def _openai_available() -> bool:
+    try:
+        import openai  # noqa: F401
+        import tenacity  # noqa: F401
+    except ImportError:
+        debug("openai/tenacity not installed, using the node translator")
+        return False
+    return True
+
+
+async def _translate_async(
+    texts: list[str],
+    openai_model: str,
+    source_lang: str,
+    target_lang: str,
+    batch_size: int,
+    openai_api_key: str,
+    openai_endpoint: str,
+    on_batch: Optional[Callable[[int, list[str]], None]] = None,
+) -> list[str]:
+    """Translate *texts* with concurrent chat completion requests of *batch_size* cues each.
+
+    ``on_batch(start, translations)`` is called as each batch finishes. A failed batch does not
+    cancel the others: every batch runs to the end before the first error is raised.
+    """
+    from openai import AsyncOpenAI
+    from tenacity import retry, stop_after_attempt, wait_exponential
+
+    debug(f"OpenAI endpoint: {openai_endpoint}")
+    debug(f"OpenAI model: {openai_model}")
+    debug(f"Translating {len(texts)} cues {source_lang} -> {target_lang}, {TRANSLATION_CONCURRENCY} requests at a time")
+
+    client = AsyncOpenAI(api_key=openai_api_key, base_url=openai_endpoint)
+    limit = asyncio.Semaphore(TRANSLATION_CONCURRENCY)
+    system = (
+        f"You translate subtitles from {source_lang} to {target_lang}. "
+        "You get a JSON array of subtitle texts and answer with a JSON array of their translations: "
+        "same length, same order, no commentary."
+    )
+
+    # a malformed answer (wrong length, not JSON) is retried the same way as a failed request
+    @retry(stop=stop_after_attempt(5), wait=wait_exponential(min=1, max=30), reraise=True)
+    async def translate_batch(batch: list[str]) -> list[str]:
+        async with limit:
+            resp = await client.chat.completions.create(
+                model=openai_model,
+                messages=[
+                    {"role": "system", "content": system},
+                    {"role": "user", "content": json.dumps(batch, ensure_ascii=False)},
+                ],
+                temperature=0,
+            )
+        answer = (resp.choices[0].message.content or "").strip()
+        answer = re.sub(r"^```(?:json)?\s*|\s*```$", "", answer)
+        translated = json.loads(answer)
+        if not isinstance(translated, list) or len(translated) != len(batch):
+            raise ValueError(f"Expected {len(batch)} translations, got: {answer[:200]}")
+        return [_BLANK_LINES_RE.sub("\n", str(t).strip()) for t in translated]
+
+    async def run_batch(start: int) -> list[str]:
+        translated = await translate_batch(texts[start : start + batch_size])
+        if on_batch is not None:
+            on_batch(start, translated)
+        return translated
+
+    try:
+        results = await asyncio.gather(*(run_batch(i) for i in range(0, len(texts), batch_size)), return_exceptions=True)
+    finally:
+        await client.close()
+    for result in results:
+        if isinstance(result, BaseException):
+            raise result
+    return [text for result in results for text in result]
+
+
+def _translate_with_node(
+    cues: list[Cue],
+    translator_path: str,
+    openai_model: str,
+    source_lang: str,
+    target_lang: str,
+    batch_sizes: str,
+    openai_api_key: str,
+    openai_endpoint: str,
+) -> list[str]:
+    with tempfile.TemporaryDirectory(prefix="translate_movie_") as tmp:
+        srt_in = os.path.join(tmp, "cues.srt")
+        srt_out = os.path.join(tmp, "cues_translated.srt")
+        write_srt(cues, srt_in)
+        _run_node_translator(
+            translator_path,
+            openai_model,
+            srt_in,
+            srt_out,
+            source_lang,
+            target_lang,
+            batch_sizes,
+            openai_api_key,
+            openai_endpoint,
+        )
+        return [cue.text for cue in read_srt(srt_out)]
+
+
+def translation_lang_key(source_lang: str, target_lang: str, openai_model: str) -> bytes:
+    """blake2b key binding cache entries to a language pair and model."""
+    return hashlib.blake2b(f"{source_lang}|{target_lang}|{openai_model}".encode(), digest_size=32).digest()
+
+
+def translation_cache_key(lang_key: bytes, text: str) -> bytes:
+    return hashlib.blake2b(text.encode(), digest_size=16, key=lang_key).digest()
+
+
+def open_translation_cache(path: str) -> sqlite3.Connection:
+    """Open (creating if needed) the SQLite translation cache at *path*."""
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    conn = sqlite3.connect(path, timeout=30)
+    conn.execute("CREATE TABLE IF NOT EXISTS t(k BLOB PRIMARY KEY, v TEXT)")
+    return conn
+
+
+def lookup_translations(conn: sqlite3.Connection, keys: list[bytes]) -> dict[bytes, str]:
+    found: dict[bytes, str] = {}
+    # stay well below SQLite's limit on bound parameters per statement
+    for i in range(0, len(keys), 500):
+        chunk = keys[i : i + 500]
+        found.update(conn.execute(f"SELECT k, v FROM t WHERE k IN ({','.join('?' * len(chunk))})", chunk))
+    return found
+
+
+def _run_node_translator(
+    translator_path: str,
+    openai_model: str,
+    srt_en: str,
+    srt_out: str,
+    source_lang: str,
+    target_lang: str,
+    batch_sizes: str,
+    openai_api_key: str,
+    openai_endpoint: str,
+) -> None:
+    """Run the node translator once on *srt_en*, writing *srt_out*."""
+    # pass node only what it needs instead of the whole environment
+    env = {
+        "PATH": os.environ.get("PATH", ""),
+        "HOME": os.environ.get("HOME", ""),
+        **{k: v for k, v in os.environ.items() if k.startswith("NODE_")},
+        "OPENAI_API_KEY": openai_api_key,
+        "OPENAI_BASE_URL": openai_endpoint,
+    }
 
     debug(f"OpenAI endpoint: {openai_endpoint}")
     debug(f"OpenAI model: {openai_model}")
@@ -148,26 +959,167 @@ def translate_subtitles(
         raise RuntimeError(f"Translation failed with exit code {proc.returncode}")
 
 
-def parse_args(argv: Optional[list[str]] = None) -> argparse.Namespace:
+def translate_cue_batches(
+    batches: "queue.Queue[Optional[list[Cue]]]",
+    srt_out: str,
+    translate: Callable[[str, str], None],
+) -> int:
+    """Translate cue batches as they arrive on *batches* and write the result to *srt_out*.
+
+    ``translate(src, dst)`` translates one SRT file into another. ``None`` on the queue ends
+    the input. Returns the number of translated cues (0 means nothing was written).
+    """
+    translated: list[Cue] = []
+    with tempfile.TemporaryDirectory(prefix="translate_movie_") as tmp:
+        part_in = os.path.join(tmp, "part.srt")
+        part_out = os.path.join(tmp, "part_translated.srt")
+        done = False
+        while not done:
+            batch = batches.get()
+            if batch is None:
+                break
+            # catch up with whisper: translate everything queued so far in a single run
+            while not batches.empty():
+                more = batches.get()
+                if more is None:
+                    done = True
+                    break
+                batch += more
+            debug(f"Translating {len(batch)} streamed cues")
+            write_srt(batch, part_in)
+            translate(part_in, part_out)
+            translated += read_srt(part_out)
+    if translated:
+        write_srt(translated, srt_out)
+    return len(translated)
+
+
+def transcribe_and_translate(
+    video_file: str,
+    video_dir: str,
+    whisper_model: str,
+    whisper_lang: str,
+    srt_out: str,
+    translate: Callable[[str, str], None],
+    chunk_size: int,
+    audio: Optional[Iterable[tuple[float, Any]]] = None,
+) -> tuple[Future, Future]:
+    """Run Whisper and the translator side by side.
+
+    Cues are handed to the translator in chunks of *chunk_size* while Whisper is still
+    transcribing. Returns the ``(whisper, translation)`` futures after both have finished;
+    the translation future's result is the count from :func:`translate_cue_batches`. If the
+    translator fails, Whisper stops queueing cues for it but still finishes and writes its
+    SRT, so a rerun with ``--skip-whisper`` can pick up from there.
+    """
+    batches: "queue.Queue[Optional[list[Cue]]]" = queue.Queue()
+    stop = threading.Event()
+
+    def produce() -> None:
+        pending: list[Cue] = []
+
+        def on_cue(cue: Cue) -> None:
+            if stop.is_set():
+                return
+            pending.append(cue)
+            if len(pending) >= chunk_size:
+                batches.put(pending[:])
+                pending.clear()
+
+        try:
+            ensure_whisper(video_file, video_dir, whisper_model, whisper_lang, on_cue=on_cue, audio=audio)
+            if pending and not stop.is_set():
+                batches.put(pending)
+        finally:
+            batches.put(None)
+
+    def consume() -> int:
+        try:
+            return translate_cue_batches(batches, srt_out, translate)
+        except BaseException:
+            stop.set()
+            raise
+
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        whisper = pool.submit(produce)
+        translation = pool.submit(consume)
+    return whisper, translation
+
+
+@functools.lru_cache(maxsize=1)
+def _build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(description="Video translation script using Whisper and LM Studio")
     group = parser.add_mutually_exclusive_group(required=False)
-    group.add_argument("--file", dest="file", help="Translate local video file")
+    group.add_argument("--file", dest="file", nargs="+", help="Translate local video file(s)")
     group.add_argument("--net", dest="net", help="Download and translate video from URL (using yt-dlp)")
     parser.add_argument("--postprocess-only", dest="postprocess_only", help="Run post-processing (rename and cleanup) for given video file")
     parser.add_argument("--skip-whisper", action="store_true", help="Skip Whisper transcription (use existing .srt file)")
     parser.add_argument("--update-ytdlp", action="store_true", help="Update yt-dlp to latest version")
-    return parser.parse_args(argv)
+    return parser
+
+
+def parse_args(argv: Optional[list[str]] = None) -> argparse.Namespace:
+    return _build_parser().parse_args(argv)
+
+
+# variables _build_config() reads, including HOME for the "~" / "$HOME" expansions
+_CONFIG_ENV_KEYS = (
+    "WHISPER_MODEL",
+    "WHISPER_LANGUAGE",
+    "OPENAI_ENDPOINT",
+    "OPENAI_API_KEY",
+    "OPENAI_MODEL",
+    "TRANSLATOR_PATH",
+    "SOURCE_LANG",
+    "TARGET_LANG",
+    "YT_DLP_PATH",
+    "YT_DLP_OUTPUT_NAME",
+    "YT_DLP_FORMAT",
+    "TRANSLATION_BATCH_SIZES",
+    "PIPELINE_CHUNK_SIZE",
+    "TRANSLATION_CACHE",
+    "HOME",
+)
+# (values of _CONFIG_ENV_KEYS, config) from the last get_config() call
+_CFG: Optional[tuple[tuple[Optional[str], ...], dict]] = None
 
 
 def get_config() -> dict:
-    """Return a dict with configuration loaded from environment (with defaults)."""
+    """Return a dict with configuration loaded from environment (with defaults).
+
+    The result is cached until one of ``_CONFIG_ENV_KEYS`` changes (other variables referenced
+    from a ``$VAR`` in a path are not watched); set ``_CFG = None`` to force a rebuild.
+    """
+    global _CFG
+    _ensure_dotenv()
+    snapshot = tuple(map(os.environ.get, _CONFIG_ENV_KEYS))
+    if _CFG is None or _CFG[0] != snapshot:
+        # expansions depend on $HOME and friends, so they go stale together with the config
+        _EXPAND_CACHE.clear()
+        _CFG = (snapshot, _build_config())
+    return dict(_CFG[1])
+
+
+# input string -> os.path.expanduser(os.path.expandvars(input)), see _expand
+_EXPAND_CACHE: dict[str, str] = {}
+
+
+def _expand(s: str) -> str:
+    """Expand ``$VARS`` and ``~`` in *s*, memoized until get_config() sees the environment change."""
+    r = _EXPAND_CACHE.get(s)
+    if r is None:
+        r = _EXPAND_CACHE[s] = os.path.expanduser(os.path.expandvars(s))
+    return r
+
+
+def _build_config() -> dict:
     return {
         "WHISPER_MODEL": os.environ.get("WHISPER_MODEL", "large"),
         "WHISPER_LANGUAGE": os.environ.get("WHISPER_LANGUAGE", "en"),
         "OPENAI_ENDPOINT": os.environ.get("OPENAI_ENDPOINT", "http://localhost:20000/v1"),
         "OPENAI_API_KEY": os.environ.get("OPENAI_API_KEY", "lm-studio"),
         "OPENAI_MODEL": os.environ.get("OPENAI_MODEL", "qwen3-30b-a3b-instruct-2507"),
-        "TRANSLATOR_PATH": os.path.expanduser(os.path.expandvars(os.environ.get("TRANSLATOR_PATH", "$HOME/tools/translateMovie/chatgpt-subtitle-translator"))),
+        "TRANSLATOR_PATH": _expand(os.environ.get("TRANSLATOR_PATH", "$HOME/tools/translateMovie/chatgpt-subtitle-translator")),
         "SOURCE_LANG": os.environ.get("SOURCE_LANG", "en"),
         "TARGET_LANG": os.environ.get("TARGET_LANG", "pl"),
         "YT_DLP_PATH": os.environ.get("YT_DLP_PATH", "/usr/local/bin/yt-dlp"),
@@ -176,9 +1128,24 @@ def get_config() -> dict:
     # use yt-dlp format selector syntax; this default limits maximum height to 360p
     "YT_DLP_FORMAT": os.environ.get("YT_DLP_FORMAT", "bestvideo[height<=360]+bestaudio/best"),
         "TRANSLATION_BATCH_SIZES": os.environ.get("TRANSLATION_BATCH_SIZES", "[5,10]"),
+        # number of whisper cues handed to the translator at a time while transcription is running
+        "PIPELINE_CHUNK_SIZE": os.environ.get("PIPELINE_CHUNK_SIZE", "100"),
+        # SQLite file memoizing cue translations across runs; set to an empty string to disable
+        "TRANSLATION_CACHE": _expand(os.environ.get("TRANSLATION_CACHE", "~/.cache/translate_movie/cache.sqlite")),
     }
 
 
+def move_file(src: str, dst: str) -> None:
+    """Rename *src* to *dst*, overwriting it; copies only when they are on different filesystems."""
+    try:
+        os.replace(src, dst)
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+        shutil.copy2(src, dst)
+        os.remove(src)
+
+
 def postprocess_subtitles(video_dir: str, video_name: str, target_lang: str) -> tuple[str, str]:
     """Rename original English srt to *_en.srt, move translated file to canonical name, and remove progress CSVs.
 
@@ -189,48 +1156,59 @@ def postprocess_subtitles(video_dir: str, video_name: str, target_lang: str) ->
 
     srt_en_final = os.path.join(video_dir, f"{video_name}_en.srt")
     try:
-        if os.path.isfile(srt_en):
-            try:
-                os.replace(srt_en, srt_en_final)
-            except Exception:
-                import shutil
-
-                shutil.copy2(srt_en, srt_en_final)
-                os.remove(srt_en)
+        move_file(srt_en, srt_en_final)
+    except FileNotFoundError:
+        pass
     except Exception as e:
         debug(f"Failed to rename original English srt: {e}")
 
     srt_canonical = os.path.join(video_dir, f"{video_name}.srt")
     try:
-        if os.path.isfile(srt_translated):
-            try:
-                os.replace(srt_translated, srt_canonical)
-            except Exception:
-                import shutil
-
-                shutil.copy2(srt_translated, srt_canonical)
-                os.remove(srt_translated)
+        move_file(srt_translated, srt_canonical)
+    except FileNotFoundError:
+        pass
     except Exception as e:
         debug(f"Failed to move translated srt to canonical name: {e}")
 
     # Cleanup: remove any progress CSV files like *.progress_pl.csv
+    suffix = f".progress_{target_lang}.csv"
     try:
-        for fname in os.listdir(video_dir):
-            if fname.endswith(f".progress_{target_lang}.csv"):
-                try:
-                    os.remove(os.path.join(video_dir, fname))
-                    debug(f"Removed progress CSV: {fname}")
-                except Exception as e:
-                    debug(f"Failed to remove {fname}: {e}")
+        with os.scandir(video_dir or ".") as it:
+            progress_files = [e.path for e in it if e.name.endswith(suffix)]
+        errors = remove_files(progress_files)
+        for path in progress_files:
+            if path in errors:
+                debug(f"Failed to remove {os.path.basename(path)}: {errors[path]}")
+            else:
+                debug(f"Removed progress CSV: {os.path.basename(path)}")
     except Exception as e:
         debug(f"Error while cleaning progress files: {e}")
 
     return srt_en_final, srt_canonical
 
 
-def main(argv: Optional[list[str]] = None) -> int:
-    # Load configuration from environment (can be provided via .env)
-    cfg = get_config()
+def _debug_translation_failure(video_dir: str, video_name: str, srt_translated: str) -> None:
+    if not DEBUG:
+        return
+    debug(f"Translated subtitles {'exist' if os.path.isfile(srt_translated) else 'missing'}: {srt_translated}")
+    with os.scandir(video_dir or ".") as it:
+        debug(f"Files for {video_name}: {sorted(e.name for e in it if e.name.startswith(video_name))}")
+
+
+def process_video(
+    cfg: dict,
+    video_file: str,
+    skip_whisper: bool = False,
+    download: Optional[tuple[subprocess.Popen, str]] = None,
+    audio: Optional[Iterable[tuple[float, Any]]] = None,
+    transcribed: bool = False,
+) -> int:
+    """Transcribe, translate and post-process one video; returns the CLI exit code.
+
+    *download* is the ``(proc, path)`` pair of a download still running in the background
+    (see :func:`download_video`) and *audio* the matching streamed audio chunks. *transcribed*
+    means Whisper already ran on the file (see :func:`transcribe_files_cli`).
+    """
     WHISPER_MODEL = cfg["WHISPER_MODEL"]
     WHISPER_LANGUAGE = cfg["WHISPER_LANGUAGE"]
     OPENAI_ENDPOINT = cfg["OPENAI_ENDPOINT"]
@@ -239,19 +1217,152 @@ def main(argv: Optional[list[str]] = None) -> int:
     TRANSLATOR_PATH = cfg["TRANSLATOR_PATH"]
     SOURCE_LANG = cfg["SOURCE_LANG"]
     TARGET_LANG = cfg["TARGET_LANG"]
-    YT_DLP_PATH = cfg["YT_DLP_PATH"]
-    YT_DLP_OUTPUT_NAME = cfg["YT_DLP_OUTPUT_NAME"]
     TRANSLATION_BATCH_SIZES = cfg["TRANSLATION_BATCH_SIZES"]
+    PIPELINE_CHUNK_SIZE = int(cfg["PIPELINE_CHUNK_SIZE"])
+    TRANSLATION_CACHE = cfg["TRANSLATION_CACHE"] or None
+
+    video_dir = os.path.dirname(video_file)
+    video_name = os.path.splitext(os.path.basename(video_file))[0]
+
+    srt_en = os.path.join(video_dir, f"{video_name}.srt")
+    srt_translated = os.path.join(video_dir, f"{video_name}_{TARGET_LANG}.srt")
+
+    debug(f"Video directory: {video_dir}")
+    debug(f"Video name (no ext): {video_name}")
+    debug(f"English SRT path: {srt_en}")
+    debug(f"Translated SRT path: {srt_translated}")
+
+    def translate_part(src: str, dst: str) -> None:
+        run_translator(
+            TRANSLATOR_PATH,
+            OPENAI_MODEL,
+            src,
+            dst,
+            SOURCE_LANG,
+            TARGET_LANG,
+            TRANSLATION_BATCH_SIZES,
+            OPENAI_API_KEY,
+            OPENAI_ENDPOINT,
+            cache_path=TRANSLATION_CACHE,
+        )
+
+    streamed = 0
+    if transcribed:
+        if not os.path.isfile(srt_en):
+            print(f"Error: Whisper failed to generate subtitles (missing {srt_en})", file=sys.stderr)
+            return 7
+    elif not skip_whisper:
+        # Whisper and the translator overlap: cues are translated while transcription continues
+        whisper, translation = transcribe_and_translate(
+            video_file,
+            video_dir,
+            WHISPER_MODEL,
+            WHISPER_LANGUAGE,
+            srt_translated,
+            translate_part,
+            PIPELINE_CHUNK_SIZE,
+            audio=audio,
+        )
+        if download:
+            proc = download[0]
+            if proc.wait() != 0 or not os.path.isfile(video_file):
+                print(f"Error: Failed to download video: yt-dlp exited with code {proc.returncode}", file=sys.stderr)
+                return 3
+            print(f"Downloaded: {video_file}")
+            # a translator failure would only repeat itself, so only Whisper errors are retried
+            if whisper.exception():
+                debug(f"Streamed transcription failed, transcribing the download: {whisper.exception()}")
+                whisper, translation = transcribe_and_translate(
+                    video_file,
+                    video_dir,
+                    WHISPER_MODEL,
+                    WHISPER_LANGUAGE,
+                    srt_translated,
+                    translate_part,
+                    PIPELINE_CHUNK_SIZE,
+                )
+        try:
+            whisper.result()
+        except subprocess.CalledProcessError as e:
+            print("Error: Whisper failed to generate subtitles", file=sys.stderr)
+            debug(f"Whisper error: returncode={e.returncode}")
+            for line in getattr(e, "stderr_tail", ()):
+                debug(f"whisper: {line}")
+            return 5
+        except Exception as e:
+            print(f"Error running Whisper: {e}", file=sys.stderr)
+            return 6
+        if not os.path.isfile(srt_en):
+            print(f"Error: Whisper failed to generate subtitles (missing {srt_en})", file=sys.stderr)
+            return 7
+        try:
+            streamed = translation.result()
+        except Exception as e:
+            print(f"Error: Translation failed - {e}", file=sys.stderr)
+            _debug_translation_failure(video_dir, video_name, srt_translated)
+            return 9
+        if streamed and streamed != len(read_srt(srt_en)):
+            # the console output did not match the final SRT; translate the file as a whole instead
+            debug(f"Streamed {streamed} cues but {srt_en} differs, retranslating the whole file")
+            streamed = 0
+    else:
+        print("=== Step 1: Skipping Whisper (using existing subtitles) ===")
+        if not os.path.isfile(srt_en):
+            print(f"Error: Subtitle file not found: {srt_en}", file=sys.stderr)
+            return 8
+
+    # Translation (unless it already happened while Whisper was running)
+    try:
+        if not streamed:
+            translate_subtitles(
+                TRANSLATOR_PATH,
+                OPENAI_MODEL,
+                srt_en,
+                srt_translated,
+                SOURCE_LANG,
+                TARGET_LANG,
+                TRANSLATION_BATCH_SIZES,
+                OPENAI_API_KEY,
+                OPENAI_ENDPOINT,
+                cache_path=TRANSLATION_CACHE,
+            )
+    except Exception as e:
+        print(f"Error: Translation failed - {e}", file=sys.stderr)
+        _debug_translation_failure(video_dir, video_name, srt_translated)
+        return 9
+
+    if not os.path.isfile(srt_translated):
+        print("Error: Translation failed - output file not found", file=sys.stderr)
+        return 10
+
+    print("\n=== Done! ===")
+    print(f"Video file: {video_file}")
+    # Post-processing: keep original English subtitles as *_en.srt, move the translation to
+    # the canonical name and remove progress CSVs
+    srt_en_final, srt_canonical = postprocess_subtitles(video_dir, video_name, TARGET_LANG)
+    print(f"English subtitles: {srt_en_final}")
+    print(f"Translated subtitles: {srt_canonical}")
+
+    return 0
 
-    # Parse CLI args early so we can handle different flows
-    args = parse_args(argv)
 
+def main(argv: Optional[list[str]] = None) -> int:
     # If called without args, show help
     if argv is None and len(sys.argv) == 1:
-        try:
-            parse_args(["--help"])
-        except SystemExit:
-            return 0
+        _build_parser().print_help()
+        return 0
+
+    _ensure_dotenv()
+    # Load configuration from environment (can be provided via .env)
+    cfg = get_config()
+    WHISPER_MODEL = cfg["WHISPER_MODEL"]
+    WHISPER_LANGUAGE = cfg["WHISPER_LANGUAGE"]
+    TARGET_LANG = cfg["TARGET_LANG"]
+    YT_DLP_PATH = cfg["YT_DLP_PATH"]
+    YT_DLP_OUTPUT_NAME = cfg["YT_DLP_OUTPUT_NAME"]
+
+    # Parse CLI args early so we can handle different flows
+    args = parse_args(argv)
 
     # Support running postprocessing alone for debugging/verification
     if getattr(args, "postprocess_only", None):
@@ -280,123 +1391,62 @@ def main(argv: Optional[list[str]] = None) -> int:
             return 2
 
     # Determine source video
+    download = None  # (yt-dlp process, future video path) while the video downloads in the background
+    audio = None
     if args.net:
-        DOWNLOAD_DIR = os.path.expanduser(os.path.expandvars("$HOME/Downloads"))
+        DOWNLOAD_DIR = _expand("$HOME/Downloads")
         os.makedirs(DOWNLOAD_DIR, exist_ok=True)
-        try:
-            video_file = download_video(args.net, DOWNLOAD_DIR, YT_DLP_PATH, YT_DLP_OUTPUT_NAME, cfg.get("YT_DLP_FORMAT"))
-        except Exception as e:
-            print(f"Error: Failed to download video: {e}", file=sys.stderr)
-            return 3
-        print(f"Downloaded: {video_file}")
-    else:
-        video_file = args.file
+        if not args.skip_whisper and faster_whisper_available():
+            # transcribe the audio while it streams in instead of waiting for the whole video
+            try:
+                download = download_video(
+                    args.net, DOWNLOAD_DIR, YT_DLP_PATH, YT_DLP_OUTPUT_NAME, cfg.get("YT_DLP_FORMAT"), stream=True
+                )
+            except Exception as e:
+                debug(f"Could not start streaming download, downloading first: {e}")
+        if download:
+            video_file = download[1]
+            audio = download_and_yield_audio_chunks(args.net, YT_DLP_PATH, WHISPER_CHUNK_SECONDS, cfg.get("YT_DLP_FORMAT"))
+        else:
+            try:
+                video_file = download_video(args.net, DOWNLOAD_DIR, YT_DLP_PATH, YT_DLP_OUTPUT_NAME, cfg.get("YT_DLP_FORMAT"))
+            except Exception as e:
+                print(f"Error: Failed to download video: {e}", file=sys.stderr)
+                return 3
+            print(f"Downloaded: {video_file}")
+        status = process_video(cfg, video_file, args.skip_whisper, download=download, audio=audio)
+        debug("Script finished")
+        return status
+
+    video_files = args.file
+    for video_file in video_files:
         if not os.path.isfile(video_file):
             print(f"Error: File not found: {video_file}", file=sys.stderr)
             return 4
 
-    video_dir = os.path.dirname(video_file)
-    video_name = os.path.splitext(os.path.basename(video_file))[0]
-
-    srt_en = os.path.join(video_dir, f"{video_name}.srt")
-    srt_translated = os.path.join(video_dir, f"{video_name}_{TARGET_LANG}.srt")
-
-    debug(f"Video directory: {video_dir}")
-    debug(f"Video name (no ext): {video_name}")
-    debug(f"English SRT path: {srt_en}")
-    debug(f"Translated SRT path: {srt_translated}")
-
-    if not args.skip_whisper:
+    transcribed = False
+    if len(video_files) > 1 and not args.skip_whisper and not faster_whisper_available():
+        # the whisper CLI loads its model once per invocation, so hand it every file at once
         try:
-            ensure_whisper(video_file, video_dir, WHISPER_MODEL, WHISPER_LANGUAGE)
+            transcribe_files_cli(video_files, WHISPER_MODEL, WHISPER_LANGUAGE)
         except subprocess.CalledProcessError as e:
             print("Error: Whisper failed to generate subtitles", file=sys.stderr)
             debug(f"Whisper error: returncode={e.returncode}")
+            for line in getattr(e, "stderr_tail", ()):
+                debug(f"whisper: {line}")
             return 5
         except Exception as e:
             print(f"Error running Whisper: {e}", file=sys.stderr)
             return 6
-        if not os.path.isfile(srt_en):
-            print(f"Error: Whisper failed to generate subtitles (missing {srt_en})", file=sys.stderr)
-            return 7
-    else:
-        print("=== Step 1: Skipping Whisper (using existing subtitles) ===")
-        if not os.path.isfile(srt_en):
-            print(f"Error: Subtitle file not found: {srt_en}", file=sys.stderr)
-            return 8
-
-    # Translation
-    try:
-        translate_subtitles(
-            TRANSLATOR_PATH,
-            OPENAI_MODEL,
-            srt_en,
-            srt_translated,
-            SOURCE_LANG,
-            TARGET_LANG,
-            TRANSLATION_BATCH_SIZES,
-            OPENAI_API_KEY,
-            OPENAI_ENDPOINT,
-        )
-    except Exception as e:
-        print(f"Error: Translation failed - {e}", file=sys.stderr)
-        debug(f"Listing files in output directory: {os.listdir(video_dir)}")
-        return 9
-
-    if not os.path.isfile(srt_translated):
-        print("Error: Translation failed - output file not found", file=sys.stderr)
-        return 10
-
-    print("\n=== Done! ===")
-    print(f"Video file: {video_file}")
-    # Post-processing: keep original English subtitles as *_en.srt
-    srt_en_final = os.path.join(video_dir, f"{video_name}_en.srt")
-    try:
-        if os.path.isfile(srt_en):
-            # If target exists, overwrite it with the original English srt
-            try:
-                os.replace(srt_en, srt_en_final)
-            except Exception:
-                # fallback to copy+remove
-                import shutil
-
-                shutil.copy2(srt_en, srt_en_final)
-                os.remove(srt_en)
-    except Exception as e:
-        debug(f"Failed to rename original English srt: {e}")
-
-    # Move translated file to canonical name (remove _<lang> suffix)
-    srt_canonical = os.path.join(video_dir, f"{video_name}.srt")
-    try:
-        if os.path.isfile(srt_translated):
-            # If canonical exists, overwrite it
-            try:
-                os.replace(srt_translated, srt_canonical)
-            except Exception:
-                import shutil
-
-                shutil.copy2(srt_translated, srt_canonical)
-                os.remove(srt_translated)
-    except Exception as e:
-        debug(f"Failed to move translated srt to canonical name: {e}")
-
-    # Cleanup: remove any progress CSV files like *.progress_pl.csv
-    try:
-        for fname in os.listdir(video_dir):
-            if fname.endswith(f".progress_{TARGET_LANG}.csv"):
-                try:
-                    os.remove(os.path.join(video_dir, fname))
-                    debug(f"Removed progress CSV: {fname}")
-                except Exception as e:
-                    debug(f"Failed to remove {fname}: {e}")
-    except Exception as e:
-        debug(f"Error while cleaning progress files: {e}")
-
-    print(f"English subtitles: {srt_en_final}")
-    print(f"Translated subtitles: {srt_canonical}")
+        transcribed = True
 
+    # faster-whisper keeps the loaded model between files (see load_faster_whisper)
+    status = 0
+    for video_file in video_files:
+        rc = process_video(cfg, video_file, args.skip_whisper, transcribed=transcribed)
+        status = status or rc
     debug("Script finished")
-    return 0
+    return status
 
 
 if __name__ == "__main__":
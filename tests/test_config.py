@@ -34,3 +34,40 @@ def test_get_config_from_env(monkeypatch):
     assert cfg["WHISPER_MODEL"] == "medium"
     assert cfg["OPENAI_API_KEY"] == "secret-key"
     assert cfg["OPENAI_ENDPOINT"] == "https://example.com/v1"
+
+
+def test_get_config_is_cached_until_env_changes(monkeypatch):
+    monkeypatch.setenv("TARGET_LANG", "de")
+    core._CFG = None
+
+    first = core.get_config()
+    first["TARGET_LANG"] = "mutated"
+    assert core.get_config()["TARGET_LANG"] == "de"
+
+    monkeypatch.setenv("TARGET_LANG", "fr")
+    assert core.get_config()["TARGET_LANG"] == "fr"
+
+
+def test_translator_path_follows_home(monkeypatch):
+    monkeypatch.delenv("TRANSLATOR_PATH", raising=False)
+    monkeypatch.setenv("HOME", "/home/one")
+    assert core.get_config()["TRANSLATOR_PATH"] == "/home/one/tools/translateMovie/chatgpt-subtitle-translator"
+
+    monkeypatch.setenv("HOME", "/home/two")
+    assert core.get_config()["TRANSLATOR_PATH"] == "/home/two/tools/translateMovie/chatgpt-subtitle-translator"
+
+
+def test_get_config_ignores_unrelated_env(monkeypatch):
+    core.get_config()
+    built = core._CFG[1]
+
+    monkeypatch.setenv("SOME_UNRELATED_VAR", "1")
+    core.get_config()
+
+    assert core._CFG[1] is built
+
+
+def test_translation_cache_expands_vars(monkeypatch):
+    monkeypatch.setenv("HOME", "/home/one")
+    monkeypatch.setenv("TRANSLATION_CACHE", "$HOME/cache.sqlite")
+    assert core.get_config()["TRANSLATION_CACHE"] == "/home/one/cache.sqlite"
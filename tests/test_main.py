@@ -0,0 +1,109 @@
+import os
+from concurrent.futures import Future
+from types import SimpleNamespace
+
+import pytest
+
+from translate_movie import core
+
+
+def test_main_translates_several_files(tmp_path, monkeypatch):
+    monkeypatch.setenv("TARGET_LANG", "pl")
+    monkeypatch.setenv("TRANSLATION_CACHE", "")
+
+    def fake_translator(translator_path, model, srt_in, srt_out, *rest, **kwargs):
+        core.write_srt([c._replace(text="pl " + c.text) for c in core.read_srt(srt_in)], srt_out)
+
+    monkeypatch.setattr(core, "run_translator", fake_translator)
+    videos = []
+    for name in ("one", "two"):
+        video = tmp_path / f"{name}.mp4"
+        video.write_bytes(b"")
+        core.write_srt([core.Cue(0, 1000, name)], str(tmp_path / f"{name}.srt"))
+        videos.append(str(video))
+
+    assert core.main(["--file", *videos, "--skip-whisper"]) == 0
+
+    for name in ("one", "two"):
+        assert core.read_srt(str(tmp_path / f"{name}.srt"))[0].text == f"pl {name}"
+        assert core.read_srt(str(tmp_path / f"{name}_en.srt"))[0].text == name
+
+
+def test_main_reports_whisper_cli_missing_output(tmp_path, monkeypatch, capsys):
+    monkeypatch.setattr(core, "faster_whisper_available", lambda: False)
+    # whisper "succeeds" but only writes subtitles for the first file
+    monkeypatch.setattr(core, "transcribe_files_cli", lambda files, *a: core.write_srt([], os.path.splitext(files[0])[0] + ".srt"))
+    monkeypatch.setattr(core, "run_translator", lambda *a, **k: core.write_srt([], a[3]))
+    videos = []
+    for name in ("one", "two"):
+        video = tmp_path / f"{name}.mp4"
+        video.write_bytes(b"")
+        videos.append(str(video))
+
+    assert core.main(["--file", *videos]) == 7
+
+    out = capsys.readouterr()
+    assert "Skipping Whisper" not in out.out
+    assert "Whisper failed to generate subtitles" in out.err
+
+
+def test_streamed_translation_failure_is_not_retranscribed(tmp_path, monkeypatch):
+    video = tmp_path / "v.mp4"
+    video.write_bytes(b"")
+    runs = []
+
+    def fake_pipeline(video_file, video_dir, *args, **kwargs):
+        runs.append(video_file)
+        core.write_srt([core.Cue(0, 1000, "hi")], str(tmp_path / "v.srt"))
+        whisper, translation = Future(), Future()
+        whisper.set_result(None)
+        translation.set_exception(RuntimeError("translator down"))
+        return whisper, translation
+
+    monkeypatch.setattr(core, "transcribe_and_translate", fake_pipeline)
+    download = (SimpleNamespace(wait=lambda: 0, returncode=0), str(video))
+
+    assert core.process_video(core.get_config(), str(video), download=download, audio=[]) == 9
+    assert len(runs) == 1
+
+
+def test_update_ytdlp_without_sudo(tmp_path, monkeypatch):
+    target = tmp_path / "yt-dlp"
+    target.write_text("old")
+    calls = []
+
+    def fake_urlretrieve(url, filename):
+        assert url == core.YT_DLP_URL
+        with open(filename, "w") as f:
+            f.write("new")
+
+    monkeypatch.setattr(core.urllib.request, "urlretrieve", fake_urlretrieve)
+    monkeypatch.setattr(core, "run_cmd", lambda cmd, **kwargs: calls.append(cmd))
+    core.update_ytdlp(str(target))
+
+    assert target.read_text() == "new"
+    assert os.access(target, os.X_OK)
+    assert not (tmp_path / "yt-dlp.tmp").exists()
+    assert calls == [[str(target), "--version"]]
+
+
+def test_download_video_picks_newest_match(tmp_path, monkeypatch):
+    yt_dlp = tmp_path / "yt-dlp"
+    yt_dlp.write_text("")
+    yt_dlp.chmod(0o755)
+    out = tmp_path / "out"
+    out.mkdir()
+    (out / "unrelated.mkv").write_text("")
+    os.utime(out / "unrelated.mkv", (3000, 3000))
+
+    def fake_download(cmd, **kwargs):
+        for name, mtime in (("dl.webm", 1000), ("dl.mp4", 2000), ("dl.part", 1500)):
+            (out / name).write_text("")
+            os.utime(out / name, (mtime, mtime))
+
+    monkeypatch.setattr(core, "run_cmd", fake_download)
+    assert core.download_video("https://example.com/v", str(out), str(yt_dlp), "dl", "") == str(out / "dl.mp4")
+
+    monkeypatch.setattr(core, "run_cmd", lambda cmd, **kwargs: None)
+    with pytest.raises(FileNotFoundError):
+        core.download_video("https://example.com/v", str(out), str(yt_dlp), "dl", "")
@@ -0,0 +1,51 @@
+import errno
+
+import pytest
+
+from translate_movie import core
+
+
+def test_postprocess_subtitles_renames_and_cleans(tmp_path):
+    (tmp_path / "movie.srt").write_text("english")
+    (tmp_path / "movie_pl.srt").write_text("polski")
+    (tmp_path / "movie.progress_pl.csv").write_text("1,2")
+    (tmp_path / "other.progress_de.csv").write_text("keep")
+
+    en, canonical = core.postprocess_subtitles(str(tmp_path), "movie", "pl")
+
+    assert (tmp_path / "movie_en.srt").read_text() == "english"
+    assert (tmp_path / "movie.srt").read_text() == "polski"
+    assert en == str(tmp_path / "movie_en.srt")
+    assert canonical == str(tmp_path / "movie.srt")
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["movie.srt", "movie_en.srt", "other.progress_de.csv"]
+
+
+def test_remove_files_with_iouring(tmp_path, monkeypatch):
+    pytest.importorskip("liburing")
+    monkeypatch.setattr(core, "USE_IOURING", True)
+    monkeypatch.setattr(core, "_IOURING_ENTRIES", 4)
+    paths = [str(tmp_path / f"{i}.progress_pl.csv") for i in range(6)]
+    for p in paths:
+        open(p, "w").close()
+    missing = str(tmp_path / "missing.csv")
+
+    errors = core.remove_files(paths + [missing])
+
+    assert list(errors) == [missing]
+    assert isinstance(errors[missing], FileNotFoundError)
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_move_file_copies_across_filesystems(tmp_path, monkeypatch):
+    src = tmp_path / "a.srt"
+    dst = tmp_path / "b.srt"
+    src.write_text("subs")
+
+    def cross_device(a, b):
+        raise OSError(errno.EXDEV, "Invalid cross-device link")
+
+    monkeypatch.setattr(core.os, "replace", cross_device)
+    core.move_file(str(src), str(dst))
+
+    assert not src.exists()
+    assert dst.read_text() == "subs"
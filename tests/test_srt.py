@@ -0,0 +1,32 @@
+from translate_movie import core
+
+
+def test_srt_roundtrip(tmp_path):
+    cues = [
+        core.Cue(0, 1500, "Hello there"),
+        core.Cue(3_723_004, 3_725_000, "Two\nlines"),
+    ]
+    path = tmp_path / "x.srt"
+    core.write_srt(cues, str(path))
+    assert path.read_text(encoding="utf-8").startswith("1\n00:00:00,000 --> 00:00:01,500\nHello there\n")
+    assert core.read_srt(str(path)) == cues
+
+
+def test_read_srt_tolerates_crlf_empty_cues_and_missing_index(tmp_path):
+    path = tmp_path / "x.srt"
+    path.write_bytes(
+        b"1\r\n00:00:01,000 --> 00:00:02,000\r\n\r\n"
+        b"00:00:03,000 --> 00:00:04,000\r\nhi\r\n  \r\n"
+        b"3\r\n00:00:05,000 --> 00:00:06,000\r\na\r\nb\r\n"
+    )
+    assert core.read_srt(str(path)) == [
+        core.Cue(1000, 2000, ""),
+        core.Cue(3000, 4000, "hi"),
+        core.Cue(5000, 6000, "a\nb"),
+    ]
+
+
+def test_parse_whisper_console_timestamp():
+    assert core.parse_timestamp("01:02.345") == 62_345
+    assert core.parse_timestamp("1:00:00.000") == 3_600_000
+    assert core.parse_timestamp("00:00:01,002") == 1_002
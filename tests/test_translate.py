@@ -0,0 +1,191 @@
+import asyncio
+import json
+import queue
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from translate_movie import core
+
+try:
+    import openai
+    import tenacity
+except ImportError:
+    openai = None
+
+requires_openai = pytest.mark.skipif(openai is None, reason="needs the openai extra")
+
+
+class FakeCompletions:
+    def __init__(self):
+        self.requests = []
+        self.reply = lambda batch: [f"pl:{t}" for t in batch]
+
+    async def create(self, model, messages, temperature):
+        batch = json.loads(messages[-1]["content"])
+        self.requests.append(batch)
+        content = json.dumps(self.reply(batch))
+        return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content))])
+
+
+class FakeAsyncOpenAI:
+    completions: FakeCompletions
+
+    def __init__(self, api_key, base_url):
+        self.chat = SimpleNamespace(completions=self.completions)
+
+    async def close(self):
+        pass
+
+
+@pytest.fixture
+def completions(monkeypatch):
+    """A fresh fake completions endpoint behind ``openai.AsyncOpenAI`` for each test."""
+    fake = FakeCompletions()
+    monkeypatch.setattr(FakeAsyncOpenAI, "completions", fake, raising=False)
+    monkeypatch.setattr(openai, "AsyncOpenAI", FakeAsyncOpenAI)
+    return fake
+
+
+@requires_openai
+def test_run_translator_with_openai_client(tmp_path, monkeypatch, completions):
+    monkeypatch.setattr(core, "USE_NODE_TRANSLATOR", False)
+    src = tmp_path / "in.srt"
+    out = tmp_path / "out.srt"
+    core.write_srt([core.Cue(i * 1000, i * 1000 + 500, f"cue {i}") for i in range(7)], str(src))
+
+    core.run_translator("translator", "model", str(src), str(out), "en", "pl", "[3,6]", "key", "http://localhost/v1")
+
+    assert completions.requests == [["cue 0", "cue 1", "cue 2"], ["cue 3", "cue 4", "cue 5"], ["cue 6"]]
+    assert [c.text for c in core.read_srt(str(out))] == [f"pl:cue {i}" for i in range(7)]
+
+
+@requires_openai
+def test_translations_never_contain_blank_lines(completions):
+    completions.reply = lambda batch: [" a\n\nb ", "c\n \n\nd"]
+
+    texts = asyncio.run(core._translate_async(["x", "y"], "model", "en", "pl", 2, "key", "http://localhost/v1"))
+
+    assert texts == ["a\nb", "c\nd"]
+
+@requires_openai
+def test_failed_batch_keeps_the_others_cached(tmp_path, monkeypatch, completions):
+    monkeypatch.setattr(core, "USE_NODE_TRANSLATOR", False)
+    monkeypatch.setattr(tenacity, "wait_exponential", lambda **kwargs: tenacity.wait_none())
+    src = tmp_path / "in.srt"
+    out = tmp_path / "out.srt"
+    cache = str(tmp_path / "cache.sqlite")
+    core.write_srt([core.Cue(i * 1000, i * 1000 + 500, f"cue {i}") for i in range(7)], str(src))
+    args = ("translator", "model", str(src), str(out), "en", "pl", "[3]", "key", "http://localhost/v1")
+
+    def flaky(batch):
+        if "cue 3" in batch:
+            raise ValueError("model went away")
+        return [f"pl:{t}" for t in batch]
+
+    completions.reply = flaky
+    with pytest.raises(ValueError):
+        core.run_translator(*args, cache_path=cache)
+
+    completions.requests.clear()
+    completions.reply = lambda batch: [f"pl:{t}" for t in batch]
+    core.run_translator(*args, cache_path=cache)
+
+    assert completions.requests == [["cue 3", "cue 4", "cue 5"]]
+    assert [c.text for c in core.read_srt(str(out))] == [f"pl:cue {i}" for i in range(7)]
+
+
+
+def test_run_translator_only_sends_cache_misses(tmp_path, monkeypatch):
+    calls = []
+
+    def fake_node(translator_path, openai_model, srt_in, srt_out, *rest):
+        cues = core.read_srt(srt_in)
+        calls.append([c.text for c in cues])
+        core.write_srt([c._replace(text=c.text.upper()) for c in cues], srt_out)
+
+    monkeypatch.setattr(core, "USE_NODE_TRANSLATOR", True)
+    monkeypatch.setattr(core, "_run_node_translator", fake_node)
+    cache = str(tmp_path / "cache" / "cache.sqlite")
+    args = ("translator", "model")
+    tail = ("en", "pl", "[5,10]", "key", "http://localhost/v1")
+
+    src = tmp_path / "in.srt"
+    out = tmp_path / "out.srt"
+    core.write_srt([core.Cue(0, 1000, "hi"), core.Cue(1000, 2000, "bye")], str(src))
+    core.run_translator(*args, str(src), str(out), *tail, cache_path=cache)
+    core.write_srt([core.Cue(0, 1000, "bye"), core.Cue(1000, 2000, "new")], str(src))
+    core.run_translator(*args, str(src), str(out), *tail, cache_path=cache)
+
+    assert calls == [["hi", "bye"], ["new"]]
+    assert [c.text for c in core.read_srt(str(out))] == ["BYE", "NEW"]
+
+
+def test_translation_cache_key_depends_on_language_pair():
+    en_pl = core.translation_lang_key("en", "pl", "model")
+    en_de = core.translation_lang_key("en", "de", "model")
+
+    key = core.translation_cache_key(en_pl, "Hello")
+
+    assert isinstance(key, bytes) and len(key) == 16
+    assert key == core.translation_cache_key(en_pl, "Hello")
+    assert key != core.translation_cache_key(en_de, "Hello")
+    assert key != core.translation_cache_key(en_pl, "Hello!")
+
+
+def test_node_translator_gets_minimal_env(monkeypatch, tmp_path):
+    seen = {}
+
+    def fake_run(cmd, env):
+        seen.update(env)
+        return SimpleNamespace(returncode=0)
+
+    monkeypatch.setattr(core.subprocess, "run", fake_run)
+    monkeypatch.setenv("NODE_OPTIONS", "--max-old-space-size=512")
+    monkeypatch.setenv("UNRELATED_SECRET", "x")
+    core._run_node_translator("tr", "model", "in.srt", "out.srt", "en", "pl", "[5]", "key", "http://localhost/v1")
+
+    assert seen["OPENAI_API_KEY"] == "key"
+    assert seen["OPENAI_BASE_URL"] == "http://localhost/v1"
+    assert seen["NODE_OPTIONS"] == "--max-old-space-size=512"
+    assert "PATH" in seen and "UNRELATED_SECRET" not in seen
+
+
+def test_translate_cue_batches_merges_and_renumbers(tmp_path):
+    batches = queue.Queue()
+    batches.put([core.Cue(0, 1000, "one"), core.Cue(1000, 2000, "two")])
+    batches.put([core.Cue(2000, 3000, "three")])
+    batches.put(None)
+
+    def fake_translate(src, dst):
+        core.write_srt([c._replace(text=c.text.upper()) for c in core.read_srt(src)], dst)
+
+    out = tmp_path / "out.srt"
+    assert core.translate_cue_batches(batches, str(out), fake_translate) == 3
+    assert [c.text for c in core.read_srt(str(out))] == ["ONE", "TWO", "THREE"]
+
+
+def test_translation_failure_lets_whisper_finish(tmp_path, monkeypatch):
+    srt_en = tmp_path / "v.srt"
+
+    def fake_whisper(video_file, video_dir, model, lang, on_cue=None, audio=None):
+        cues = []
+        for i in range(100):
+            cues.append(core.Cue(i * 1000, i * 1000 + 500, f"cue {i}"))
+            on_cue(cues[-1])
+            time.sleep(0.001)
+        core.write_srt(cues, str(srt_en))
+
+    def failing_translate(src, dst):
+        raise RuntimeError("translator down")
+
+    monkeypatch.setattr(core, "ensure_whisper", fake_whisper)
+    whisper, translation = core.transcribe_and_translate(
+        "v.mp4", str(tmp_path), "model", "en", str(tmp_path / "out.srt"), failing_translate, 2
+    )
+
+    assert whisper.exception() is None
+    assert isinstance(translation.exception(), RuntimeError)
+    # the English subtitles stay on disk for a --skip-whisper rerun
+    assert len(core.read_srt(str(srt_en))) == 100
@@ -0,0 +1,108 @@
+import sys
+from types import SimpleNamespace
+
+import pytest
+
+from translate_movie import core
+
+
+class FakePipeline:
+    def transcribe(self, audio, language, batch_size):
+        segments = (SimpleNamespace(start=s, end=e, text=t) for s, e, t in [(0.0, 1.25, " Hi"), (2.0, 3.5, " there")])
+        return segments, SimpleNamespace(duration=3.5)
+
+
+def test_ensure_whisper_uses_faster_whisper(tmp_path, monkeypatch):
+    monkeypatch.setattr(core, "USE_FASTER_WHISPER", True)
+    monkeypatch.setattr(core, "load_faster_whisper", lambda model: (FakePipeline(), 1))
+    seen = []
+
+    core.ensure_whisper(str(tmp_path / "movie.mp4"), str(tmp_path), "large", "en", on_cue=seen.append)
+
+    expected = [core.Cue(0, 1250, "Hi"), core.Cue(2000, 3500, "there")]
+    assert seen == expected
+    assert core.read_srt(str(tmp_path / "movie.srt")) == expected
+
+
+FFMPEG_LOG = """
+  Duration: 00:10:00.00, start: 0.000000, bitrate: 128 kb/s
+[silencedetect @ 0x1] silence_start: 100
+[silencedetect @ 0x1] silence_end: 101 | silence_duration: 1
+[silencedetect @ 0x1] silence_start: 250.5
+[silencedetect @ 0x1] silence_end: 251.5 | silence_duration: 1
+[silencedetect @ 0x1] silence_start: 420
+[silencedetect @ 0x1] silence_end: 422 | silence_duration: 2
+[silencedetect @ 0x1] silence_start: 590
+"""
+
+
+def test_silence_cut_points():
+    duration, cuts = core._silence_cut_points(FFMPEG_LOG, 150)
+    assert duration == 600
+    # 100.5 is too early, 590 would leave a tiny tail chunk
+    assert cuts == [251.0, 421.0]
+
+
+def test_split_audio_on_silence_skips_decode_without_cuts(tmp_path, monkeypatch):
+    calls = []
+
+    def fake_run_cmd(cmd, **kwargs):
+        calls.append(cmd)
+        return SimpleNamespace(stderr=b"  Duration: 00:02:00.00, start: 0.000000\n")
+
+    monkeypatch.setattr(core, "run_cmd", fake_run_cmd)
+
+    assert core.split_audio_on_silence("in.mp4", str(tmp_path), 300) == [(0.0, 120.0, "in.mp4")]
+    assert len(calls) == 1
+
+
+def test_ensure_whisper_offsets_parallel_chunks(tmp_path, monkeypatch):
+    monkeypatch.setattr(core, "USE_FASTER_WHISPER", True)
+    monkeypatch.setattr(core, "load_faster_whisper", lambda model: (FakePipeline(), 2))
+    monkeypatch.setattr(
+        core, "split_audio_on_silence", lambda video, work_dir, seconds: [(0.0, 300.0, "a.wav"), (300.0, 600.0, "b.wav")]
+    )
+    seen = []
+
+    core.ensure_whisper(str(tmp_path / "movie.mp4"), str(tmp_path), "large", "en", on_cue=seen.append)
+
+    assert [c.start for c in seen] == [0, 2000, 300_000, 302_000]
+    assert core.read_srt(str(tmp_path / "movie.srt")) == seen
+
+
+def test_ensure_whisper_transcribes_streamed_audio(tmp_path, monkeypatch):
+    monkeypatch.setattr(core, "USE_FASTER_WHISPER", True)
+    monkeypatch.setattr(core, "load_faster_whisper", lambda model: (FakePipeline(), 1))
+    audio = iter([(0.0, "samples-a"), (120.5, "samples-b")])
+
+    core.ensure_whisper(str(tmp_path / "movie.mp4"), str(tmp_path), "large", "en", audio=audio)
+
+    assert [c.start for c in core.read_srt(str(tmp_path / "movie.srt"))] == [0, 2000, 120_500, 122_500]
+
+
+def test_quiet_cut_picks_silent_frame():
+    np = pytest.importorskip("numpy")
+    samples = np.ones(core._SAMPLE_RATE * 10, dtype=np.float32)
+    samples[core._SAMPLE_RATE * 7 : core._SAMPLE_RATE * 7 + 1600] = 0.0
+
+    assert core._quiet_cut(samples) == core._SAMPLE_RATE * 7 + 800
+
+
+def test_run_whisper_keeps_stderr_tail_on_failure(monkeypatch):
+    monkeypatch.setattr(core, "DEBUG", True)
+    monkeypatch.setattr(core, "WHISPER_STDERR_TAIL", 3)
+    script = "import sys\nfor i in range(10): print('err', i, file=sys.stderr)\nprint('out')\nsys.exit(2)"
+    lines = []
+
+    with pytest.raises(core.subprocess.CalledProcessError) as exc:
+        core.run_whisper([sys.executable, "-c", script], lines.append)
+
+    assert exc.value.returncode == 2
+    assert exc.value.stderr_tail == ["err 7", "err 8", "err 9"]
+    assert lines == ["out\n"]
+
+
+def test_audio_format_follows_video_format():
+    assert core._audio_format("bestvideo[height<=360]+bestaudio/best") == "bestaudio/worst"
+    assert core._audio_format("bv*+ba[language=de]/b[height<=480]") == "ba[language=de]/b[height<=480]"
+    assert core._audio_format("") == "bestaudio/worst"